@@ -1,5 +1,7 @@
 import streamlit as st
-import pandas as pd
+
+from utils.data import load_data
+from utils.warmup import render_startup_timings, start_warmup
 
 st.set_page_config(
     page_title="NBA Dashboard",
@@ -11,15 +13,22 @@ st.title("🏀 Dashboard NBA - All Seasons")
 st.write("Aplicação criada como trabalho de programação utilizando Streamlit + CSV.")
 st.markdown("Os dados são carregados automaticamente do arquivo `data/all_seasons.csv`.")
 
+# Aquece dataset, agregados e bibliotecas de gráficos em segundo plano
+start_warmup()
+
 # Carregamento automático do dataset
-@st.cache_data
-def load_data():
-    return pd.read_csv("data/all_seasons.csv")
+with st.spinner("Carregando dataset..."):
+    df = load_data()
+
+if df.empty:
+    st.error("❌ Arquivo 'data/all_seasons.csv' não encontrado!")
+    st.stop()
 
-df = load_data()
 st.session_state["df"] = df
 
 st.success("Dataset carregado com sucesso!")
 
 st.subheader("Pré-visualização dos dados")
-st.dataframe(df.head())
\ No newline at end of file
+st.dataframe(df.head())
+
+render_startup_timings()
@@ -0,0 +1,61 @@
+"""Compara dois resultados de ``benchmarks.run_pages`` (p.ex. de commits diferentes).
+
+Uso::
+
+    python -m benchmarks.compare benchmarks/results/abc1234.json benchmarks/results/def5678.json
+"""
+import argparse
+import json
+
+METRICS = ("cold_s", "warm_s", "peak_rss_mb")
+
+
+def _index(report):
+    # (escala, página) -> resultado; com --repeat fica a última execução
+    return {
+        (result["scale"], result["page"]): result
+        for result in report["results"]
+        if "error" not in result
+    }
+
+
+def _flatten(result):
+    values = {metric: result[metric] for metric in METRICS}
+    for name, seconds in result["interactions_s"].items():
+        values[f"{name}_s"] = seconds
+    for fmt, seconds in result.get("exports_s", {}).items():
+        values[f"export_{fmt}_s"] = seconds
+    return values
+
+
+def compare(base, new):
+    base_index, new_index = _index(base), _index(new)
+    rows = []
+    for key in sorted(base_index.keys() & new_index.keys()):
+        before, after = _flatten(base_index[key]), _flatten(new_index[key])
+        for metric in before.keys() & after.keys():
+            ratio = after[metric] / before[metric] if before[metric] else None
+            rows.append((*key, metric, before[metric], after[metric], ratio))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("base")
+    parser.add_argument("new")
+    args = parser.parse_args()
+
+    with open(args.base, encoding="utf-8") as file:
+        base = json.load(file)
+    with open(args.new, encoding="utf-8") as file:
+        new = json.load(file)
+
+    print(f"base: {base['metadata']['commit']}  novo: {new['metadata']['commit']}")
+    print(f"{'escala':>7} {'página':<12} {'métrica':<24} {'base':>10} {'novo':>10} {'razão':>7}")
+    for scale, page, metric, before, after, ratio in compare(base, new):
+        ratio_text = f"{ratio:.2f}x" if ratio is not None else "—"
+        print(f"{'x' + str(scale):>7} {page:<12} {metric:<24} {before:>10.3f} {after:>10.3f} {ratio_text:>7}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,373 @@
+"""Teste de carga local com várias sessões simultâneas no servidor Streamlit.
+
+Sobe ``streamlit run app.py`` em localhost e simula N navegadores falando o
+protocolo do websocket (``/_stcore/stream``, protobufs ``BackMsg``/``ForwardMsg``).
+Cada sessão percorre as páginas em ciclo: navega até a página e depois altera
+os filtros algumas vezes com valores aleatórios, esperando o ``script_finished``
+de cada rerun antes de enviar o próximo, como um usuário faria.
+
+Para cada N o servidor é reiniciado e são medidos: reruns por segundo, latência
+p50/p95/p99 por página, uso de CPU do servidor e memória por sessão
+(pico de RSS do servidor acima da linha de base, dividido por N). Nada sai de localhost.
+
+Uso::
+
+    python -m benchmarks.loadtest --sessions 1 5 10 25 --duration 30
+    python -m benchmarks.loadtest --sessions 1 2 4 8 16 --pages Exploracao --scale 10
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+
+import numpy as np
+from websockets.asyncio.client import connect
+
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+from benchmarks import synthetic
+from benchmarks.run_pages import RESULTS_DIR, ROOT, environment_metadata
+
+try:
+    import psutil
+except ImportError:  # psutil é opcional; sem ele CPU e memória vêm de /proc
+    psutil = None
+
+DEFAULT_PAGES = ["Resumo", "Exploracao", "Comparacoes"]
+
+# Quantas mudanças de filtro cada sessão faz em uma página antes de trocar de página
+FILTER_CHANGES = 2
+
+# Intervalo (s) entre amostras de CPU/memória do servidor
+SAMPLE_INTERVAL = 0.5
+
+# Widgets alterados pelas sessões simuladas, por rótulo
+MULTISELECT_SIZES = {
+    "Selecionar Temporadas:": (1, 6),
+    "Selecione métricas para comparar:": (2, 4),
+}
+SLIDER_LABELS = {"Faixa de Altura (cm):", "Número de intervalos"}
+SELECTBOX_LABELS = {
+    "Selecione a métrica:",
+    "Selecione uma temporada para análise detalhada:",
+    "Selecione a temporada:",
+    "Métrica para comparação:",
+}
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _process_stats(pid):
+    """Devolve ``(segundos de CPU, RSS em bytes)`` do processo, ou ``(None, None)``."""
+    if psutil is not None:
+        process = psutil.Process(pid)
+        cpu = process.cpu_times()
+        return cpu.user + cpu.system, process.memory_info().rss
+    try:
+        with open(f"/proc/{pid}/stat") as stat:
+            # Os campos após o nome do processo (que pode conter espaços)
+            fields = stat.read().rsplit(")", 1)[1].split()
+        cpu = (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+        with open(f"/proc/{pid}/statm") as statm:
+            rss = int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+        return cpu, rss
+    except (OSError, ValueError, IndexError):
+        return None, None
+
+
+class Server:
+    """Processo ``streamlit run`` isolado, em uma porta livre de localhost."""
+
+    def __init__(self, data_path=None, startup_timeout=60):
+        self.port = _free_port()
+        self.data_path = data_path
+        self.startup_timeout = startup_timeout
+        self.process = None
+
+    @property
+    def url(self):
+        return f"ws://127.0.0.1:{self.port}/_stcore/stream"
+
+    def __enter__(self):
+        env = dict(os.environ)
+        if self.data_path:
+            env["NBA_DATA_PATH"] = self.data_path
+        self.process = subprocess.Popen(
+            [sys.executable, "-m", "streamlit", "run", "app.py",
+             "--server.headless", "true",
+             "--server.address", "127.0.0.1",
+             "--server.port", str(self.port),
+             "--server.fileWatcherType", "none",
+             "--browser.gatherUsageStats", "false"],
+            cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+        self._wait_healthy()
+        return self
+
+    def _wait_healthy(self):
+        deadline = time.monotonic() + self.startup_timeout
+        health = f"http://127.0.0.1:{self.port}/_stcore/health"
+        while time.monotonic() < deadline:
+            if self.process.poll() is not None:
+                raise RuntimeError(f"streamlit terminou com código {self.process.returncode}")
+            try:
+                with urllib.request.urlopen(health, timeout=1) as response:
+                    if response.status == 200:
+                        return
+            except (urllib.error.URLError, OSError):
+                pass
+            time.sleep(0.2)
+        raise TimeoutError("streamlit não respondeu ao health check")
+
+    def stats(self):
+        return _process_stats(self.process.pid)
+
+    def __exit__(self, *exc):
+        self.process.terminate()
+        try:
+            self.process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+
+
+class Session:
+    """Uma sessão de navegador simulada sobre o websocket do Streamlit."""
+
+    def __init__(self, websocket, rng):
+        self.websocket = websocket
+        self.rng = rng
+        self.pages = {}
+        self.widgets = {}
+        self.errors = 0
+
+    async def rerun(self, page_hash="", widget_states=()):
+        msg = BackMsg()
+        msg.rerun_script.page_script_hash = page_hash
+        msg.rerun_script.widget_states.widgets.extend(widget_states)
+
+        # Os widgets são reconstruídos a cada rerun, a partir dos deltas recebidos
+        self.widgets = {}
+        start = time.perf_counter()
+        await self.websocket.send(msg.SerializeToString())
+
+        while True:
+            forward = ForwardMsg()
+            forward.ParseFromString(await self.websocket.recv())
+            kind = forward.WhichOneof("type")
+
+            if kind == "navigation":
+                self.pages = {
+                    page.page_name.lower(): page.page_script_hash
+                    for page in forward.navigation.app_pages
+                }
+            elif kind == "delta" and forward.delta.WhichOneof("type") == "new_element":
+                element = forward.delta.new_element
+                element_type = element.WhichOneof("type")
+                if element_type in ("multiselect", "slider", "selectbox"):
+                    widget = getattr(element, element_type)
+                    self.widgets[widget.label] = (element_type, widget)
+                elif element_type == "exception":
+                    self.errors += 1
+            elif kind == "script_finished":
+                return time.perf_counter() - start
+
+    def random_widget_states(self):
+        states = []
+        for label, (element_type, widget) in self.widgets.items():
+            state = WidgetState(id=widget.id)
+            if element_type == "multiselect" and label in MULTISELECT_SIZES and widget.options:
+                low, high = MULTISELECT_SIZES[label]
+                size = self.rng.randint(min(low, len(widget.options)), min(high, len(widget.options)))
+                state.string_array_value.data.extend(self.rng.sample(list(widget.options), size))
+            elif element_type == "slider" and label in SLIDER_LABELS:
+                values = sorted(self.rng.randint(int(widget.min), int(widget.max)) for _ in widget.default)
+                state.double_array_value.data.extend(float(value) for value in values)
+            elif element_type == "selectbox" and label in SELECTBOX_LABELS and widget.options:
+                state.string_value = self.rng.choice(list(widget.options))
+            else:
+                continue
+            states.append(state)
+        return states
+
+
+async def _run_session(index, url, page_names, deadline, seed, samples):
+    rng = random.Random(seed + index)
+    async with connect(url, subprotocols=["streamlit"], max_size=None) as websocket:
+        session = Session(websocket, rng)
+        samples.append(("app", "inicial", await session.rerun()))
+
+        # Começa em páginas diferentes para não sincronizar as sessões
+        offset = index % len(page_names)
+        cycle = page_names[offset:] + page_names[:offset]
+        while time.monotonic() < deadline:
+            for name in cycle:
+                page_hash = session.pages.get(name.lower())
+                if page_hash is None:
+                    raise ValueError(f"página {name!r} não encontrada; disponíveis: {sorted(session.pages)}")
+                samples.append((name, "navegar", await session.rerun(page_hash)))
+                for _ in range(FILTER_CHANGES):
+                    if time.monotonic() >= deadline:
+                        break
+                    states = session.random_widget_states()
+                    samples.append((name, "filtro", await session.rerun(page_hash, states)))
+                if time.monotonic() >= deadline:
+                    break
+    return session.errors
+
+
+async def _warm_up(url, page_names):
+    # Uma visita a cada página antes de medir: imports, dataset e caches ficam fora da linha de base
+    async with connect(url, subprotocols=["streamlit"], max_size=None) as websocket:
+        session = Session(websocket, random.Random(0))
+        await session.rerun()
+        for name in page_names:
+            await session.rerun(session.pages[name.lower()])
+
+
+async def _sample_server(server, stop, readings):
+    while not stop.is_set():
+        readings.append(server.stats())
+        try:
+            await asyncio.wait_for(stop.wait(), SAMPLE_INTERVAL)
+        except asyncio.TimeoutError:
+            pass
+
+
+def _percentiles(latencies):
+    if not latencies:
+        return {}
+    values = np.array(latencies) * 1000
+    return {
+        "p50_ms": float(np.percentile(values, 50)),
+        "p95_ms": float(np.percentile(values, 95)),
+        "p99_ms": float(np.percentile(values, 99)),
+        "max_ms": float(values.max()),
+    }
+
+
+async def _load_level(server, sessions, page_names, duration, seed):
+    await _warm_up(server.url, page_names)
+    cpu_before, baseline_rss = server.stats()
+    client_before = os.times()
+    readings = []
+    stop = asyncio.Event()
+    sampler = asyncio.create_task(_sample_server(server, stop, readings))
+
+    samples = []
+    start = time.monotonic()
+    deadline = start + duration
+    outcomes = await asyncio.gather(
+        *(_run_session(index, server.url, page_names, deadline, seed, samples) for index in range(sessions)),
+        return_exceptions=True
+    )
+    elapsed = time.monotonic() - start
+    stop.set()
+    await sampler
+
+    cpu_after, final_rss = server.stats()
+    client_after = os.times()
+    failures = [repr(outcome) for outcome in outcomes if isinstance(outcome, BaseException)]
+    rss_values = [rss for _, rss in readings if rss is not None]
+    measured = [sample for sample in samples if sample[1] != "inicial"]
+
+    result = {
+        "sessions": sessions,
+        "duration_s": elapsed,
+        "reruns": len(measured),
+        "reruns_per_s": len(measured) / elapsed,
+        "latency": _percentiles([seconds for _, _, seconds in measured]),
+        "pages": {
+            name: {
+                "reruns": len(latencies),
+                **_percentiles(latencies),
+            }
+            for name in page_names
+            if (latencies := [seconds for page, _, seconds in measured if page == name])
+        },
+        "first_run": _percentiles([seconds for _, kind, seconds in samples if kind == "inicial"]),
+        "script_errors": sum(outcome for outcome in outcomes if isinstance(outcome, int)),
+        "session_failures": failures,
+        # CPU do cliente de carga, para perceber quando é ele o gargalo
+        "client_cpu_pct": 100 * ((client_after.user - client_before.user)
+                                 + (client_after.system - client_before.system)) / elapsed,
+    }
+    if cpu_before is not None:
+        result["server_cpu_pct"] = 100 * (cpu_after - cpu_before) / elapsed
+        result["server_rss_baseline_mb"] = baseline_rss / 1024 ** 2
+        # O RSS final é lido com as sessões já desconectadas (mantidas até o TTL e
+        # com páginas liberadas retidas pelo alocador); o pico reflete a carga
+        peak_rss = max(rss_values, default=final_rss)
+        result["server_rss_peak_mb"] = peak_rss / 1024 ** 2
+        result["server_rss_final_mb"] = final_rss / 1024 ** 2
+        result["memory_per_session_mb"] = (peak_rss - baseline_rss) / sessions / 1024 ** 2
+    return result
+
+
+def _format(result):
+    latency = result["latency"]
+    line = (f"N={result['sessions']:<4} {result['reruns_per_s']:6.2f} reruns/s  "
+            f"p50={latency.get('p50_ms', 0):7.0f}ms p95={latency.get('p95_ms', 0):7.0f}ms "
+            f"p99={latency.get('p99_ms', 0):7.0f}ms")
+    if "server_cpu_pct" in result:
+        line += (f"  cpu={result['server_cpu_pct']:5.0f}%  "
+                 f"mem/sessão={result['memory_per_session_mb']:6.1f}MB")
+    if result["session_failures"]:
+        line += f"  falhas={len(result['session_failures'])}"
+    return line
+
+
+def run(levels, page_names, duration, data_path=None, seed=0):
+    results = []
+    for sessions in levels:
+        # Servidor novo a cada nível, para que a memória por sessão não acumule níveis anteriores
+        with Server(data_path) as server:
+            result = asyncio.run(_load_level(server, sessions, page_names, duration, seed))
+        results.append(result)
+        print(_format(result), flush=True)
+        for name, stats in result["pages"].items():
+            print(f"    {name:<12} {stats['reruns']:5d} reruns  "
+                  f"p50={stats['p50_ms']:7.0f}ms p95={stats['p95_ms']:7.0f}ms", flush=True)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1, 2, 5, 10, 25])
+    parser.add_argument("--pages", nargs="+", default=DEFAULT_PAGES,
+                        help="páginas percorridas pelas sessões (nome exibido na navegação)")
+    parser.add_argument("--duration", type=float, default=30, help="duração (s) de cada nível de carga")
+    parser.add_argument("--scale", type=int, default=1, help="escala do dataset sintético (1 = original)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="arquivo JSON de saída (padrão: benchmarks/results/loadtest-<commit>.json)")
+    args = parser.parse_args()
+
+    os.chdir(ROOT)
+    data_path = os.path.abspath(synthetic.ensure(args.scale)) if args.scale != 1 else None
+
+    results = run(args.sessions, args.pages, args.duration, data_path, args.seed)
+
+    metadata = environment_metadata()
+    metadata.update(scale=args.scale, pages=args.pages, duration_s=args.duration,
+                    filter_changes_per_page=FILTER_CHANGES)
+    output = args.output or os.path.join(RESULTS_DIR, f"loadtest-{metadata['commit'] or 'local'}.json")
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    with open(output, "w", encoding="utf-8") as file:
+        json.dump({"metadata": metadata, "results": results}, file, indent=2)
+    print(f"Resultados gravados em {output}")
+
+
+if __name__ == "__main__":
+    main()
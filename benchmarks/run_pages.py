@@ -0,0 +1,271 @@
+"""Benchmark headless das páginas com ``streamlit.testing.v1.AppTest``.
+
+Para cada escala do dataset sintético e cada página, um subprocesso novo
+executa a página (rerun frio), repete o rerun sem mudanças (rerun quente) e
+aplica uma sequência fixa de interações nos widgets, medindo cada rerun. Nas
+páginas com exportação também é medido o download em CSV e Parquet da visão
+filtrada, à parte (``exports_s``). O pico de memória é o ``ru_maxrss`` do
+subprocesso, lido antes das exportações.
+
+Uso::
+
+    python -m benchmarks.run_pages --scale 1 10 100
+    python -m benchmarks.compare benchmarks/results/<antes>.json benchmarks/results/<depois>.json
+"""
+import argparse
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import time
+
+from benchmarks import synthetic
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS_DIR = os.path.join("benchmarks", "results")
+
+
+def _widget(widgets, label):
+    return next(widget for widget in widgets if widget.label == label)
+
+
+def _select_seasons(at):
+    widget = _widget(at.sidebar.multiselect, "Selecionar Temporadas:")
+    widget.set_value(widget.options[:10])
+
+
+def _narrow_heights(at):
+    widget = _widget(at.sidebar.slider, "Faixa de Altura (cm):")
+    widget.set_value((widget.min + 10, widget.max - 10))
+
+
+def _set_bins(at):
+    at.slider(key="height_bins").set_value(40)
+
+
+def _select_metric(label, value):
+    def action(at):
+        _widget(at.selectbox, label).set_value(value)
+    return action
+
+
+def _select_option(label, index):
+    def action(at):
+        widget = _widget(at.selectbox, label)
+        widget.set_value(widget.options[index])
+    return action
+
+
+def _select_comparison_metrics(at):
+    widget = _widget(at.multiselect, "Selecione métricas para comparar:")
+    widget.set_value(widget.options[:4])
+
+
+def _exploracao_view(at, df):
+    # Mesmos filtros da barra lateral de 02_Exploracao.py, com os valores atuais dos widgets
+    seasons = _widget(at.sidebar.multiselect, "Selecionar Temporadas:").value
+    if seasons:
+        df = df[df["season"].isin(seasons)]
+    low, high = _widget(at.sidebar.slider, "Faixa de Altura (cm):").value
+    return df[(df["player_height"] >= low) & (df["player_height"] <= high)]
+
+
+def _comparacoes_view(at, df):
+    # Mesma visão por temporada que 03_Comparacoes.py exporta
+    season = _widget(at.selectbox, "Selecione a temporada:").value
+    return df[df["season"] == season]
+
+
+# Página -> visão filtrada que a seção de exportação da página recebe
+EXPORT_VIEWS = {
+    "exploracao": _exploracao_view,
+    "comparacoes": _comparacoes_view,
+}
+
+
+def _timed_exports(view):
+    """Executa a exportação como no clique do ``st.download_button``.
+
+    O retorno de ``export_to_tempfile`` passa pela mesma conversão que o Streamlit
+    aplica em ``data`` adiada, então um tipo não suportado falha o benchmark.
+    """
+    from streamlit.runtime.download_data_util import convert_data_to_bytes_and_infer_mime
+
+    from utils.export import EXPORT_FORMATS, export_to_tempfile
+
+    timings = {}
+    for fmt in EXPORT_FORMATS:
+        start = time.perf_counter()
+        with export_to_tempfile(view, list(view.columns), fmt) as fileobj:
+            data, _ = convert_data_to_bytes_and_infer_mime(
+                fileobj, RuntimeError(f"exportação {fmt}: tipo {type(fileobj).__name__} não suportado")
+            )
+        if not data:
+            raise RuntimeError(f"exportação {fmt} vazia")
+        timings[fmt.lower()] = time.perf_counter() - start
+    return timings
+
+
+# Página -> (script, interações aplicadas em sequência)
+PAGES = {
+    "resumo": ("pages/01_Resumo.py", [
+        ("temporadas", _select_seasons),
+        ("altura", _narrow_heights),
+        ("intervalos", _set_bins),
+        ("metrica", _select_metric("Selecione a métrica:", "pts")),
+    ]),
+    "exploracao": ("pages/02_Exploracao.py", [
+        ("temporadas", _select_seasons),
+        ("altura", _narrow_heights),
+        ("temporada_detalhe", _select_option("Selecione uma temporada para análise detalhada:", -1)),
+    ]),
+    "comparacoes": ("pages/03_Comparacoes.py", [
+        ("temporada", _select_option("Selecione a temporada:", -1)),
+        ("metrica", _select_metric("Métrica para comparação:", "pts")),
+        ("metricas", _select_comparison_metrics),
+    ]),
+}
+
+
+def _peak_rss_mb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux informa em KB, macOS em bytes
+    return peak / 1024 ** 2 if sys.platform == "darwin" else peak / 1024
+
+
+def _timed_run(at):
+    start = time.perf_counter()
+    at.run()
+    seconds = time.perf_counter() - start
+    if at.exception:
+        raise RuntimeError(at.exception[0].value)
+    return seconds
+
+
+def run_worker(page, data_path, timeout):
+    """Executa uma página em um processo novo e devolve as medições."""
+    os.environ["NBA_DATA_PATH"] = data_path
+    sys.path.insert(0, ROOT)
+
+    start = time.perf_counter()
+    from streamlit.testing.v1 import AppTest
+    import_s = time.perf_counter() - start
+
+    script, interactions = PAGES[page]
+    at = AppTest.from_file(os.path.join(ROOT, script), default_timeout=timeout)
+
+    cold_s = _timed_run(at)
+    warm_s = _timed_run(at)
+    steps = {}
+    for name, action in interactions:
+        action(at)
+        steps[name] = _timed_run(at)
+
+    # Lido antes das exportações para que o pico continue sendo o das páginas
+    result = {
+        "page": page,
+        "import_s": import_s,
+        "cold_s": cold_s,
+        "warm_s": warm_s,
+        "interactions_s": steps,
+        "peak_rss_mb": _peak_rss_mb(),
+    }
+    if page in EXPORT_VIEWS:
+        from utils.data import load_data
+
+        result["exports_s"] = _timed_exports(EXPORT_VIEWS[page](at, load_data()))
+    return result
+
+
+def _count_rows(path):
+    with open(path, "rb") as file:
+        return sum(chunk.count(b"\n") for chunk in iter(lambda: file.read(1 << 20), b"")) - 1
+
+
+def _git(*args):
+    try:
+        return subprocess.run(
+            ["git", *args], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def environment_metadata():
+    import pandas
+    import streamlit
+
+    return {
+        "commit": _git("rev-parse", "--short", "HEAD"),
+        "dirty": bool(_git("status", "--porcelain", "--untracked-files=no")),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "streamlit": streamlit.__version__,
+        "pandas": pandas.__version__,
+    }
+
+
+def run(scales, pages, timeout, repeat=1):
+    results = []
+    for scale in scales:
+        data_path = os.path.abspath(synthetic.ensure(scale))
+        rows = _count_rows(data_path)
+        for page in pages:
+            for attempt in range(repeat):
+                completed = subprocess.run(
+                    [sys.executable, "-m", "benchmarks.run_pages", "--worker", page,
+                     "--data", data_path, "--timeout", str(timeout)],
+                    cwd=ROOT, capture_output=True, text=True
+                )
+                if completed.returncode != 0:
+                    error = completed.stderr.strip().splitlines()[-1:] or ["erro desconhecido"]
+                    result = {"page": page, "error": error[0]}
+                else:
+                    result = json.loads(completed.stdout.strip().splitlines()[-1])
+                result.update(scale=scale, rows=rows, attempt=attempt)
+                results.append(result)
+                print(_format(result), flush=True)
+    return {"metadata": environment_metadata(), "results": results}
+
+
+def _format(result):
+    prefix = f"x{result['scale']:<5} {result['page']:<12}"
+    if "error" in result:
+        return f"{prefix} ERRO: {result['error']}"
+    steps = " ".join(f"{name}={seconds:.2f}s" for name, seconds in result["interactions_s"].items())
+    steps += "".join(f" export_{fmt}={seconds:.2f}s" for fmt, seconds in result.get("exports_s", {}).items())
+    return (f"{prefix} frio={result['cold_s']:.2f}s quente={result['warm_s']:.2f}s "
+            f"{steps} pico={result['peak_rss_mb']:.0f}MB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", type=int, nargs="+", default=[1, 10, 100, 1000])
+    parser.add_argument("--page", nargs="+", choices=list(PAGES), default=list(PAGES))
+    parser.add_argument("--repeat", type=int, default=1, help="execuções por página e escala")
+    parser.add_argument("--timeout", type=float, default=600, help="timeout (s) de cada rerun")
+    parser.add_argument("--output", help="arquivo JSON de saída (padrão: benchmarks/results/<commit>.json)")
+    parser.add_argument("--worker", choices=list(PAGES), help=argparse.SUPPRESS)
+    parser.add_argument("--data", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    # Caminhos relativos (dados, resultados) são sempre resolvidos a partir da raiz do repositório
+    os.chdir(ROOT)
+
+    if args.worker:
+        print(json.dumps(run_worker(args.worker, args.data, args.timeout)))
+        return
+
+    report = run(args.scale, args.page, args.timeout, args.repeat)
+    output = args.output or os.path.join(RESULTS_DIR, f"{report['metadata']['commit'] or 'local'}.json")
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    with open(output, "w", encoding="utf-8") as file:
+        json.dump(report, file, indent=2)
+    print(f"Resultados gravados em {output}")
+
+
+if __name__ == "__main__":
+    main()
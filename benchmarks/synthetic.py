@@ -0,0 +1,117 @@
+"""Gera versões sintéticas e ampliadas de ``data/all_seasons.csv``.
+
+Cada réplica copia as carreiras reais (jogador -> temporadas -> times) com um
+novo nome de jogador e aplica ruído às colunas numéricas:
+
+- atributos físicos recebem um deslocamento por carreira, para que altura e
+  peso continuem constantes ao longo das temporadas de um mesmo jogador;
+- estatísticas de desempenho recebem ruído por linha;
+- tudo é limitado ao intervalo observado e arredondado como no original.
+
+Assim a estrutura temporada/time/jogador e as distribuições das colunas são
+preservadas, com ``scale`` vezes mais linhas.
+
+Uso::
+
+    python -m benchmarks.synthetic --scale 10 100 1000
+"""
+import argparse
+import os
+
+import numpy as np
+import pandas as pd
+
+SOURCE_PATH = "data/all_seasons.csv"
+OUTPUT_DIR = os.path.join("benchmarks", "data")
+
+# Desvio do ruído, como fração do desvio padrão da coluna no dataset real
+CAREER_NOISE = {"player_height": 0.15, "player_weight": 0.15}
+ROW_NOISE = {
+    "pts": 0.1, "reb": 0.1, "ast": 0.1, "net_rating": 0.1,
+    "oreb_pct": 0.1, "dreb_pct": 0.1, "usg_pct": 0.1, "ts_pct": 0.1, "ast_pct": 0.1,
+}
+INT_NOISE = {"gp": 3}
+DECIMALS = {"player_height": 2, "player_weight": 3, "pts": 1, "reb": 1, "ast": 1, "net_rating": 1}
+DEFAULT_DECIMALS = 3
+
+
+def synthetic_path(scale, output_dir=OUTPUT_DIR):
+    return os.path.join(output_dir, f"all_seasons_x{scale}.csv")
+
+
+def _replica(df, codes, n_players, replica, rng, stds, bounds):
+    out = df.copy()
+    out["player_name"] = df["player_name"] + f" #{replica}"
+
+    for col, fraction in CAREER_NOISE.items():
+        offsets = rng.normal(0, stds[col] * fraction, n_players)[codes]
+        out[col] = df[col] + offsets
+
+    for col, fraction in ROW_NOISE.items():
+        out[col] = df[col] + rng.normal(0, stds[col] * fraction, len(df))
+
+    for col, spread in INT_NOISE.items():
+        out[col] = df[col] + rng.integers(-spread, spread + 1, len(df))
+
+    for col in [*CAREER_NOISE, *ROW_NOISE, *INT_NOISE]:
+        low, high = bounds[col]
+        out[col] = out[col].clip(low, high)
+        if col in INT_NOISE:
+            out[col] = out[col].round().astype(df[col].dtype)
+        else:
+            out[col] = out[col].round(DECIMALS.get(col, DEFAULT_DECIMALS))
+    return out
+
+
+def generate(scale, source=SOURCE_PATH, dest=None, seed=0):
+    """Escreve o dataset ampliado em ``dest`` réplica por réplica e devolve o caminho.
+
+    A réplica 0 é o dataset original; a memória usada fica limitada a uma réplica.
+    """
+    dest = dest or synthetic_path(scale)
+    os.makedirs(os.path.dirname(dest) or ".", exist_ok=True)
+
+    df = pd.read_csv(source, index_col=0)
+    codes, players = pd.factorize(df["player_name"])
+    numeric = [*CAREER_NOISE, *ROW_NOISE, *INT_NOISE]
+    stds = df[numeric].std()
+    bounds = {col: (df[col].min(), df[col].max()) for col in numeric}
+    rng = np.random.default_rng(seed)
+
+    tmp_path = dest + ".tmp"
+    offset = 0
+    with open(tmp_path, "w", encoding="utf-8", newline="") as file:
+        for replica in range(scale):
+            chunk = df if replica == 0 else _replica(df, codes, len(players), replica, rng, stds, bounds)
+            chunk.index = pd.RangeIndex(offset, offset + len(chunk))
+            chunk.to_csv(file, header=replica == 0)
+            offset += len(chunk)
+    os.replace(tmp_path, dest)
+    return dest
+
+
+def ensure(scale, **kwargs):
+    """Gera o dataset apenas se ele ainda não existir."""
+    dest = kwargs.get("dest") or synthetic_path(scale)
+    if scale == 1:
+        return kwargs.get("source", SOURCE_PATH)
+    if not os.path.exists(dest):
+        generate(scale, **kwargs)
+    return dest
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--source", default=SOURCE_PATH)
+    parser.add_argument("--output-dir", default=OUTPUT_DIR)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    for scale in args.scale:
+        path = generate(scale, args.source, synthetic_path(scale, args.output_dir), args.seed)
+        print(f"x{scale}: {path} ({os.path.getsize(path) / 1024 ** 2:.1f} MB)")
+
+
+if __name__ == "__main__":
+    main()
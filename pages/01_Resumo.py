@@ -1,9 +1,11 @@
 import streamlit as st
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
 import numpy as np
 
+from utils.data import load_data
+from utils.profiling import render_profiling_sidebar, timed
+from utils.warmup import start_warmup
+
 # Configuração da página
 st.set_page_config(
     page_title="🏀 NBA Players Analytics",
@@ -39,103 +41,104 @@ def apply_custom_style():
     """, unsafe_allow_html=True)
 
 apply_custom_style()
+start_warmup()
 
 # Título principal
 st.markdown('<h1 class="main-header">🏀 NBA Players Analytics Dashboard</h1>', unsafe_allow_html=True)
 
 # Carregar dados
-@st.cache_data
-def load_data():
-    try:
-        df = pd.read_csv("data/all_seasons.csv")
-        return df
-    except FileNotFoundError:
-        st.error("❌ Arquivo 'data/all_seasons.csv' não encontrado!")
-        st.info("💡 Certifique-se de que o arquivo está na pasta 'data'")
-        return pd.DataFrame()
-
-df = load_data()
+with timed("resumo/dados"):
+    df = load_data()
 
 if df.empty:
+    st.error("❌ Arquivo 'data/all_seasons.csv' não encontrado!")
+    st.info("💡 Certifique-se de que o arquivo está na pasta 'data'")
     st.stop()
 
 st.sidebar.header("🎛️ Filtros")
 
-# Filtro por temporada
-if 'season' in df.columns:
-    seasons = sorted(df['season'].unique())
-    selected_seasons = st.sidebar.multiselect(
-        "Selecionar Temporadas:",
-        options=seasons,
-        default=seasons[:3] if len(seasons) > 3 else seasons
-    )
-    if selected_seasons:
-        df = df[df['season'].isin(selected_seasons)]
+with timed("resumo/filtros"):
+    # Filtro por temporada
+    if 'season' in df.columns:
+        seasons = sorted(df['season'].unique())
+        selected_seasons = st.sidebar.multiselect(
+            "Selecionar Temporadas:",
+            options=seasons,
+            default=seasons[:3] if len(seasons) > 3 else seasons
+        )
+        if selected_seasons:
+            df = df[df['season'].isin(selected_seasons)]
 
-# Filtro por altura
-if 'player_height' in df.columns:
-    min_height = int(df['player_height'].min())
-    max_height = int(df['player_height'].max())
-    height_range = st.sidebar.slider(
-        "Faixa de Altura (cm):",
-        min_value=min_height,
-        max_value=max_height,
-        value=(min_height, max_height)
-    )
-    df = df[(df['player_height'] >= height_range[0]) & 
-            (df['player_height'] <= height_range[1])]
+    # Filtro por altura
+    if 'player_height' in df.columns:
+        min_height = int(df['player_height'].min())
+        max_height = int(df['player_height'].max())
+        height_range = st.sidebar.slider(
+            "Faixa de Altura (cm):",
+            min_value=min_height,
+            max_value=max_height,
+            value=(min_height, max_height)
+        )
+        df = df[(df['player_height'] >= height_range[0]) & 
+                (df['player_height'] <= height_range[1])]
 
 st.markdown('<h2 class="section-header">📊 Métricas Principais</h2>', unsafe_allow_html=True)
 
-col1, col2, col3, col4 = st.columns(4)
+with timed("resumo/metricas"):
+    col1, col2, col3, col4 = st.columns(4)
 
-with col1:
-    total_players = df.shape[0]
-    unique_players = df["player_name"].nunique()
-    st.metric(
-        label="👥 Total de Registros",
-        value=f"{total_players:,}",
-        delta=f"{unique_players:,} jogadores únicos"
-    )
-
-with col2:
-    avg_height = df['player_height'].mean()
-    height_std = df['player_height'].std()
-    st.metric(
-        label="📏 Altura Média",
-        value=f"{avg_height:.1f} cm",
-        delta=f"±{height_std:.1f} cm"
-    )
+    with col1:
+        total_players = df.shape[0]
+        unique_players = df["player_name"].nunique()
+        st.metric(
+            label="👥 Total de Registros",
+            value=f"{total_players:,}",
+            delta=f"{unique_players:,} jogadores únicos"
+        )
 
-with col3:
-    avg_weight = df['player_weight'].mean()
-    weight_std = df['player_weight'].std()
-    st.metric(
-        label="⚖️ Peso Médio",
-        value=f"{avg_weight:.1f} kg",
-        delta=f"±{weight_std:.1f} kg"
-    )
+    with col2:
+        avg_height = df['player_height'].mean()
+        height_std = df['player_height'].std()
+        st.metric(
+            label="📏 Altura Média",
+            value=f"{avg_height:.1f} cm",
+            delta=f"±{height_std:.1f} cm"
+        )
 
-with col4:
-    if 'age' in df.columns:
-        avg_age = df['age'].mean()
-        age_std = df['age'].std()
+    with col3:
+        avg_weight = df['player_weight'].mean()
+        weight_std = df['player_weight'].std()
         st.metric(
-            label="🎂 Idade Média",
-            value=f"{avg_age:.1f} anos",
-            delta=f"±{age_std:.1f} anos"
+            label="⚖️ Peso Médio",
+            value=f"{avg_weight:.1f} kg",
+            delta=f"±{weight_std:.1f} kg"
         )
-    elif 'team_position' in df.columns:
-        positions = df['team_position'].nunique()
-        st.metric("🏆 Posições", f"{positions}")
-    else:
-        st.metric("📈 Dados", "Disponíveis")
+
+    with col4:
+        if 'age' in df.columns:
+            avg_age = df['age'].mean()
+            age_std = df['age'].std()
+            st.metric(
+                label="🎂 Idade Média",
+                value=f"{avg_age:.1f} anos",
+                delta=f"±{age_std:.1f} anos"
+            )
+        elif 'team_position' in df.columns:
+            positions = df['team_position'].nunique()
+            st.metric("🏆 Posições", f"{positions}")
+        else:
+            st.metric("📈 Dados", "Disponíveis")
 
 st.divider()
 
+# Bibliotecas de gráficos só são carregadas depois que as métricas já foram exibidas
+with timed("resumo/imports"):
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
 tab1, tab2, tab3 = st.tabs(["📈 Distribuições", "⚖️ Relações", "📊 Análises"])
 
-with tab1:
+with tab1, timed("resumo/distribuicao_altura"):
     st.markdown('<h3 class="section-header">Distribuição de Altura</h3>', unsafe_allow_html=True)
     
     col_config, col_chart = st.columns([1, 3])
@@ -178,9 +181,10 @@ with tab1:
         ax.grid(True, alpha=0.3)
         ax.set_facecolor('#f8f9fa')
         
-        st.pyplot(fig)
+        with timed("rasterizacao"):
+            st.pyplot(fig)
 
-with tab2:
+with tab2, timed("resumo/altura_vs_peso"):
     st.markdown('<h3 class="section-header">Relação Altura vs Peso</h3>', unsafe_allow_html=True)
     
     col_config, col_chart = st.columns([1, 3])
@@ -233,8 +237,9 @@ with tab2:
         
         # Linha de regressão
         if show_regression:
-            sns.regplot(data=df, x="player_height", y="player_weight", 
-                       scatter=False, ax=ax, color='red', line_kws={'linewidth': 2})
+            with timed("regplot"):
+                sns.regplot(data=df, x="player_height", y="player_weight", 
+                           scatter=False, ax=ax, color='red', line_kws={'linewidth': 2})
         
         ax.set_xlabel("Altura (cm)", fontweight='bold', fontsize=12)
         ax.set_ylabel("Peso (kg)", fontweight='bold', fontsize=12)
@@ -242,9 +247,10 @@ with tab2:
         ax.grid(True, alpha=0.3)
         ax.set_facecolor('#f8f9fa')
         
-        st.pyplot(fig)
+        with timed("rasterizacao"):
+            st.pyplot(fig)
 
-with tab3:
+with tab3, timed("resumo/analise_metrica"):
     st.markdown('<h3 class="section-header">Análise por Métrica</h3>', unsafe_allow_html=True)
     
     # Selecionar métricas disponíveis
@@ -347,14 +353,15 @@ with tab3:
             ax.grid(True, alpha=0.3)
             ax.set_facecolor('#f8f9fa')
             
-            st.pyplot(fig)
+            with timed("rasterizacao"):
+                st.pyplot(fig)
 
 st.divider()
 st.markdown('<h3 class="section-header">📋 Resumo do Dataset</h3>', unsafe_allow_html=True)
 
 col_info1, col_info2 = st.columns(2)
 
-with col_info1:
+with col_info1, timed("resumo/resumo_dataset"):
     st.markdown('<div class="metric-container">', unsafe_allow_html=True)
     st.write("**📊 Informações Gerais:**")
     st.write(f"- **Total de registros:** {len(df):,}")
@@ -392,4 +399,6 @@ st.sidebar.info("""
 - Explore todas as abas de gráficos
 - Passe o mouse para ver detalhes
 - **Valores ±** indicam desvio padrão
-""")
\ No newline at end of file
+""")
+
+render_profiling_sidebar()
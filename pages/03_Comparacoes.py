@@ -1,29 +1,29 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import seaborn as sns
-import matplotlib.pyplot as plt
+
+from utils.charts import metric_precision, plotly_chart
+from utils.data import load_data, season_means
+from utils.export import render_export_section
+from utils.figures import heatmap_png
+from utils.profiling import render_profiling_sidebar, timed
+from utils.warmup import start_warmup
 
 st.set_page_config(page_title="Comparações", layout="wide")
 st.title("⚔ Comparações Entre Jogadores")
 
-@st.cache_data
-def load_data():
-    try:
-        df = pd.read_csv("data/all_seasons.csv")
-        return df
-    except FileNotFoundError:
-        st.error("❌ Arquivo 'data/all_seasons.csv' não encontrado!")
-        return pd.DataFrame()
+start_warmup()
 
-df = load_data()
+with timed("comparacoes/dados"):
+    df = load_data()
 
 if df.empty:
+    st.error("❌ Arquivo 'data/all_seasons.csv' não encontrado!")
     st.stop()
 
-for col in ("player_height", "player_weight", "age", "pts", "reb", "ast"):
-    if col in df.columns:
-        df[col] = pd.to_numeric(df[col], errors="coerce")
+with timed("comparacoes/conversao_numerica"):
+    for col in ("player_height", "player_weight", "age", "pts", "reb", "ast"):
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], errors="coerce")
 
 st.header("🎯 Filtros de Comparação")
 
@@ -45,29 +45,38 @@ if not selected_season or not selected_metric:
     st.info("Selecione uma temporada e métrica para ver as comparações.")
     st.stop()
 
-df_season = df[df["season"] == selected_season] if selected_season else df
+with timed("comparacoes/filtro_temporada"):
+    df_season = df[df["season"] == selected_season] if selected_season else df
+
+# Bibliotecas de gráficos só são carregadas quando há algo para desenhar
+with timed("comparacoes/imports"):
+    import plotly.express as px
+
+metric_digits = metric_precision(selected_metric)
 
 st.divider()
 
 st.header("📊 Top Jogadores por Métrica")
 
-if selected_metric in df_season.columns:
-    top_players = df_season.nlargest(10, selected_metric)[['player_name', selected_metric]].dropna()
+with timed("comparacoes/top_jogadores"):
+    if selected_metric in df_season.columns:
+        with timed("nlargest"):
+            top_players = df_season.nlargest(10, selected_metric)[['player_name', selected_metric]].dropna()
     
-    if not top_players.empty:
-        fig1 = px.bar(
-            top_players,
-            x=selected_metric,
-            y='player_name',
-            orientation='h',
-            title=f"Top 10 Jogadores - {selected_metric.replace('_', ' ').title()} ({selected_season})",
-            color=selected_metric,
-            color_continuous_scale='viridis'
-        )
-        fig1.update_layout(yaxis={'categoryorder':'total ascending'})
-        st.plotly_chart(fig1, use_container_width=True)
-    else:
-        st.info(f"Não há dados de {selected_metric} para a temporada selecionada.")
+        if not top_players.empty:
+            fig1 = px.bar(
+                top_players,
+                x=selected_metric,
+                y='player_name',
+                orientation='h',
+                title=f"Top 10 Jogadores - {selected_metric.replace('_', ' ').title()} ({selected_season})",
+                color=selected_metric,
+                color_continuous_scale='viridis'
+            )
+            fig1.update_layout(yaxis={'categoryorder':'total ascending'})
+            plotly_chart(fig1, precision={"x": metric_digits, "marker.color": metric_digits}, use_container_width=True)
+        else:
+            st.info(f"Não há dados de {selected_metric} para a temporada selecionada.")
 
 st.divider()
 
@@ -75,7 +84,7 @@ st.header("📈 Distribuição da Métrica Selecionada")
 
 col1, col2 = st.columns(2)
 
-with col1:
+with col1, timed("comparacoes/histograma"):
     if selected_metric in df_season.columns:
         fig2 = px.histogram(
             df_season,
@@ -84,9 +93,9 @@ with col1:
             title=f"Distribuição de {selected_metric.replace('_', ' ').title()}",
             color_discrete_sequence=['blue']
         )
-        st.plotly_chart(fig2, use_container_width=True)
+        plotly_chart(fig2, use_container_width=True)
 
-with col2:
+with col2, timed("comparacoes/box_plot"):
     if selected_metric in df_season.columns:
         fig3 = px.box(
             df_season,
@@ -94,59 +103,55 @@ with col2:
             title=f"Box Plot - {selected_metric.replace('_', ' ').title()}",
             color_discrete_sequence=['red']
         )
-        st.plotly_chart(fig3, use_container_width=True)
+        plotly_chart(fig3, use_container_width=True)
 
 st.divider()
 
 st.header("🔄 Comparação entre Temporadas")
 
-if "season" in df.columns and selected_metric in df.columns:
-    season_stats = df.groupby('season')[selected_metric].mean().reset_index()
+with timed("comparacoes/evolucao_temporadas"):
+    if "season" in df.columns and selected_metric in df.columns:
+        # Normalmente um acerto de cache; o groupby só roda quando a métrica é nova
+        with timed("medias_por_temporada"):
+            season_stats = season_means(selected_metric)
     
-    if not season_stats.empty:
-        fig4 = px.line(
-            season_stats,
-            x='season',
-            y=selected_metric,
-            title=f"Evolução da {selected_metric.replace('_', ' ').title()} ao Longo das Temporadas",
-            markers=True
-        )
-        if selected_season in season_stats['season'].values:
-            selected_value = season_stats[season_stats['season'] == selected_season][selected_metric].values[0]
-            fig4.add_scatter(
-                x=[selected_season],
-                y=[selected_value],
-                mode='markers',
-                marker=dict(size=12, color='red'),
-                name='Temporada Selecionada'
+        if not season_stats.empty:
+            fig4 = px.line(
+                season_stats,
+                x='season',
+                y=selected_metric,
+                title=f"Evolução da {selected_metric.replace('_', ' ').title()} ao Longo das Temporadas",
+                markers=True
             )
-        st.plotly_chart(fig4, use_container_width=True)
+            if selected_season in season_stats['season'].values:
+                selected_value = season_stats[season_stats['season'] == selected_season][selected_metric].values[0]
+                fig4.add_scatter(
+                    x=[selected_season],
+                    y=[selected_value],
+                    mode='markers',
+                    marker=dict(size=12, color='red'),
+                    name='Temporada Selecionada'
+                )
+            plotly_chart(fig4, precision={"y": metric_digits + 1}, use_container_width=True)
 
 st.divider()
 
 st.header("🎪 Comparação de Múltiplas Métricas")
 
-if len(metric_options) >= 2:
-    selected_metrics = st.multiselect(
-        "Selecione métricas para comparar:",
-        options=metric_options,
-        default=metric_options[:2] if len(metric_options) >= 2 else metric_options
-    )
-    
-    if len(selected_metrics) >= 2:
-        corr_data = df_season[selected_metrics].corr()
-        
-        fig5, ax = plt.subplots(figsize=(8, 6))
-        sns.heatmap(
-            corr_data,
-            annot=True,
-            cmap="coolwarm",
-            center=0,
-            square=True,
-            ax=ax
+with timed("comparacoes/correlacao"):
+    if len(metric_options) >= 2:
+        selected_metrics = st.multiselect(
+            "Selecione métricas para comparar:",
+            options=metric_options,
+            default=metric_options[:2] if len(metric_options) >= 2 else metric_options
         )
-        ax.set_title("Correlação entre Métricas Selecionadas")
-        st.pyplot(fig5)
+    
+        if len(selected_metrics) >= 2:
+            with timed("corr"):
+                corr_data = df_season[selected_metrics].corr()
+            with timed("heatmap"):
+                png = heatmap_png(corr_data, "Correlação entre Métricas Selecionadas")
+            st.image(png, width="stretch")
 
 st.divider()
 
@@ -154,7 +159,7 @@ st.header("📋 Estatísticas Detalhadas")
 
 col1, col2 = st.columns(2)
 
-with col1:
+with col1, timed("comparacoes/estatisticas"):
     if selected_metric in df_season.columns:
         st.write(f"**Estatísticas de {selected_metric.replace('_', ' ').title()}:**")
         stats = df_season[selected_metric].describe()
@@ -169,10 +174,19 @@ with col2:
         st.metric("Mínimo", f"{stats['min']:.2f}")
         st.metric("Contagem", f"{stats['count']:.0f}")
 
+st.divider()
+
+st.header("💾 Exportar Dados")
+
+with timed("comparacoes/exportacao"):
+    render_export_section(df_season, key="comparacoes", file_prefix=f"nba_{selected_season}")
+
 st.sidebar.markdown("---")
 st.sidebar.info(
     "💡 **Dicas de Uso:**\n"
     "- Compare jogadores por diferentes métricas\n"
     "- Analise a evolução temporal das estatísticas\n"
     "- Veja correlações entre diferentes medidas de performance"
-)
\ No newline at end of file
+)
+
+render_profiling_sidebar()
@@ -0,0 +1,93 @@
+import streamlit as st
+import pandas as pd
+
+from utils.data import DATA_PATH, cache_manager
+from utils.profiling import render_profiling_table
+from utils.warmup import start_warmup
+
+st.set_page_config(page_title="Admin", layout="wide")
+st.title("🛠️ Administração")
+
+start_warmup()
+
+used = cache_manager.total_bytes
+budgeted = cache_manager.budgeted_bytes
+budget = cache_manager.max_bytes
+
+col1, col2, col3 = st.columns(3)
+
+with col1:
+    st.metric("Memória em uso", f"{used / 1024 ** 2:.1f} MB")
+
+with col2:
+    st.metric("Orçamento", f"{budget / 1024 ** 2:.0f} MB")
+
+with col3:
+    st.metric("Entradas", f"{len(cache_manager.entries())}")
+
+st.progress(min(budgeted / budget, 1.0), text=f"{budgeted / budget:.1%} do orçamento utilizado")
+unbudgeted = ", ".join(sorted(cache_manager.unbudgeted))
+if unbudgeted:
+    st.caption(f"Fora do orçamento (nunca evictados): {unbudgeted}.")
+st.caption(f"Versão dos dados: `{DATA_PATH}` — o cache é descartado quando o arquivo muda.")
+
+st.divider()
+
+st.header("📦 Cache por Namespace")
+
+stats = pd.DataFrame(cache_manager.stats())
+stats["bytes"] = (stats["bytes"] / 1024).round(1)
+stats["hit_ratio"] = stats["hit_ratio"].map(lambda ratio: f"{ratio:.1%}" if pd.notna(ratio) else "—")
+stats["budgeted"] = stats["budgeted"].map({True: "Sim", False: "Não"})
+stats = stats.rename(columns={
+    "namespace": "Namespace",
+    "entries": "Entradas",
+    "bytes": "KB",
+    "ttl": "TTL (s)",
+    "budgeted": "No orçamento",
+    "hits": "Acertos",
+    "misses": "Falhas",
+    "hit_ratio": "Taxa de acerto",
+    "evictions": "Evicções",
+    "expirations": "Expiradas",
+    "invalidations": "Invalidações",
+    "rejections": "Recusadas",
+    "clears": "Limpezas",
+})
+st.dataframe(stats, hide_index=True, use_container_width=True)
+
+st.header("🗂️ Entradas (mais recentes primeiro)")
+
+entries = pd.DataFrame(cache_manager.entries())
+if entries.empty:
+    st.info("O cache está vazio.")
+else:
+    entries["bytes"] = (entries["bytes"] / 1024).round(1)
+    entries = entries.rename(columns={
+        "namespace": "Namespace",
+        "function": "Função",
+        "bytes": "KB",
+        "age_s": "Idade (s)",
+        "expires_in_s": "Expira em (s)",
+    })
+    st.dataframe(entries, hide_index=True, use_container_width=True)
+
+st.divider()
+
+col_ns, col_button = st.columns([2, 1])
+
+with col_ns:
+    namespace = st.selectbox("Namespace a limpar:", ["Todos"] + list(cache_manager.ttls))
+
+with col_button:
+    st.write("")
+    if st.button("🗑️ Limpar cache"):
+        cache_manager.clear(None if namespace == "Todos" else namespace)
+        st.rerun()
+
+st.divider()
+
+st.header("⏱️ Latência por Seção")
+st.caption("Agregada entre reruns e sessões deste processo do servidor.")
+
+render_profiling_table()
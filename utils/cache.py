@@ -0,0 +1,261 @@
+import functools
+import os
+import pickle
+import sys
+import threading
+import time
+from collections import Counter, OrderedDict, defaultdict
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+# Orçamento global de memória para todos os namespaces
+MAX_BYTES = 256 * 1024 * 1024
+
+# TTL (s) por namespace; None = sem expiração (só invalidado pela versão dos dados)
+NAMESPACE_TTLS = {
+    "dataset": None,
+    "aggregate": 60 * 60,
+    "figure": 10 * 60,
+}
+
+# Namespaces fora do orçamento: o dataset é a base de todo o resto e, nas escalas
+# maiores, sozinho passa de MAX_BYTES; recusá-lo faria cada rerun reler o CSV
+UNBUDGETED_NAMESPACES = frozenset({"dataset"})
+
+
+@dataclass
+class CacheEntry:
+    namespace: str
+    name: str
+    value: object
+    size: int
+    created: float
+    expires: float | None
+
+
+def estimate_size(value):
+    """Tamanho aproximado em bytes do valor guardado no cache."""
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        usage = value.memory_usage(deep=True)
+        return int(usage.sum() if isinstance(value, pd.DataFrame) else usage)
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    try:
+        return len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        return sys.getsizeof(value)
+
+
+def _freeze(obj):
+    # Converte argumentos em algo hashable para compor a chave do cache
+    if isinstance(obj, (pd.DataFrame, pd.Series)):
+        hashed = pd.util.hash_pandas_object(obj, index=True)
+        return (type(obj).__name__, obj.shape, int(hashed.sum()), tuple(getattr(obj, "columns", ())))
+    if isinstance(obj, dict):
+        return tuple(sorted((key, _freeze(value)) for key, value in obj.items()))
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        items = sorted(obj, key=repr) if isinstance(obj, (set, frozenset)) else obj
+        return tuple(_freeze(item) for item in items)
+    return obj
+
+
+class CacheManager:
+    """Cache em memória compartilhado entre sessões, com orçamento de bytes e LRU.
+
+    As entradas são agrupadas em namespaces ("dataset", "aggregate", "figure"),
+    cada um com seu TTL. Só os namespaces fora de ``unbudgeted`` contam para
+    ``max_bytes`` e podem ser evictados. Quando a versão dos dados muda, todo o
+    cache é descartado.
+    """
+
+    def __init__(self, max_bytes=MAX_BYTES, ttls=None, version_func=None, unbudgeted=None):
+        self.max_bytes = max_bytes
+        self.ttls = dict(NAMESPACE_TTLS if ttls is None else ttls)
+        self.unbudgeted = frozenset(UNBUDGETED_NAMESPACES if unbudgeted is None else unbudgeted)
+        self.version_func = version_func
+        self._version = None
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._budgeted_bytes = 0
+        self._stats = {namespace: Counter() for namespace in self.ttls}
+        self._lock = threading.RLock()
+        # Um lock por chave em cálculo, como no st.cache_data: sessões que pedem a
+        # mesma chave ausente esperam o primeiro cálculo em vez de repeti-lo
+        self._compute_locks = defaultdict(threading.Lock)
+
+    @property
+    def total_bytes(self):
+        return self._bytes
+
+    @property
+    def budgeted_bytes(self):
+        """Bytes que contam para ``max_bytes`` (todos exceto os namespaces fora do orçamento)."""
+        return self._budgeted_bytes
+
+    def _check_version(self):
+        if self.version_func is None:
+            return
+        version = self.version_func()
+        if version != self._version:
+            if self._version is not None:
+                for namespace in {entry.namespace for entry in self._entries.values()}:
+                    self._stats[namespace]["invalidations"] += 1
+                self._drop_all()
+            self._version = version
+
+    def _drop_all(self):
+        self._entries.clear()
+        self._bytes = 0
+        self._budgeted_bytes = 0
+
+    def _remove(self, key, reason):
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+        if entry.namespace not in self.unbudgeted:
+            self._budgeted_bytes -= entry.size
+        self._stats[entry.namespace][reason] += 1
+
+    def _evict(self):
+        # LRU: o item menos usado recentemente fica no início do OrderedDict
+        while self._budgeted_bytes > self.max_bytes:
+            key = next(key for key, entry in self._entries.items() if entry.namespace not in self.unbudgeted)
+            self._remove(key, "evictions")
+
+    def _lookup(self, key):
+        # Chamado com self._lock adquirido; descarta a entrada se o TTL venceu
+        self._check_version()
+        entry = self._entries.get(key)
+        if entry is not None and entry.expires is not None and entry.expires <= time.monotonic():
+            self._remove(key, "expirations")
+            return None
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def get(self, namespace, key):
+        """Devolve ``(True, valor)`` em caso de acerto ou ``(False, None)``."""
+        with self._lock:
+            stats = self._stats.setdefault(namespace, Counter())
+            entry = self._lookup(key)
+            if entry is None:
+                stats["misses"] += 1
+                return False, None
+            stats["hits"] += 1
+            return True, entry.value
+
+    def set(self, namespace, key, value, name=""):
+        size = estimate_size(value)
+        ttl = self.ttls.get(namespace)
+        now = time.monotonic()
+        with self._lock:
+            self._check_version()
+            if key in self._entries:
+                self._remove(key, "replacements")
+            budgeted = namespace not in self.unbudgeted
+            if budgeted and size > self.max_bytes:
+                # Maior que o orçamento inteiro: não vale a pena guardar
+                self._stats.setdefault(namespace, Counter())["rejections"] += 1
+                return
+            self._entries[key] = CacheEntry(
+                namespace=namespace,
+                name=name,
+                value=value,
+                size=size,
+                created=now,
+                expires=None if ttl is None else now + ttl,
+            )
+            self._bytes += size
+            if budgeted:
+                self._budgeted_bytes += size
+                self._evict()
+
+    def clear(self, namespace=None):
+        with self._lock:
+            for key in [key for key, entry in self._entries.items() if namespace in (None, entry.namespace)]:
+                self._remove(key, "clears")
+
+    def cached(self, namespace):
+        """Decorador que guarda o resultado da função no namespace indicado."""
+        def decorator(func):
+            name = f"{func.__module__}.{func.__qualname__}"
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                key = (namespace, name, _freeze(args), _freeze(kwargs))
+                found, value = self.get(namespace, key)
+                if found:
+                    return value
+
+                with self._lock:
+                    compute_lock = self._compute_locks[key]
+                try:
+                    with compute_lock:
+                        # Outra thread pode ter calculado o valor enquanto esperávamos
+                        with self._lock:
+                            entry = self._lookup(key)
+                        if entry is not None:
+                            return entry.value
+                        value = func(*args, **kwargs)
+                        self.set(namespace, key, value, name=func.__qualname__)
+                        return value
+                finally:
+                    with self._lock:
+                        # Quem chegar depois encontra o valor já no cache
+                        if self._compute_locks.get(key) is compute_lock:
+                            del self._compute_locks[key]
+
+            wrapper.clear = lambda: self.clear(namespace)
+            return wrapper
+        return decorator
+
+    def stats(self):
+        """Resumo por namespace: entradas, bytes, acertos, falhas e evicções."""
+        with self._lock:
+            rows = []
+            for namespace in sorted(set(self._stats) | set(self.ttls)):
+                counter = self._stats.get(namespace, Counter())
+                entries = [entry for entry in self._entries.values() if entry.namespace == namespace]
+                lookups = counter["hits"] + counter["misses"]
+                rows.append({
+                    "namespace": namespace,
+                    "entries": len(entries),
+                    "bytes": sum(entry.size for entry in entries),
+                    "ttl": self.ttls.get(namespace),
+                    "budgeted": namespace not in self.unbudgeted,
+                    "hits": counter["hits"],
+                    "misses": counter["misses"],
+                    "hit_ratio": counter["hits"] / lookups if lookups else None,
+                    "evictions": counter["evictions"],
+                    "expirations": counter["expirations"],
+                    "invalidations": counter["invalidations"],
+                    "rejections": counter["rejections"],
+                    "clears": counter["clears"],
+                })
+            return rows
+
+    def entries(self):
+        now = time.monotonic()
+        with self._lock:
+            return [
+                {
+                    "namespace": entry.namespace,
+                    "function": entry.name,
+                    "bytes": entry.size,
+                    "age_s": round(now - entry.created, 1),
+                    "expires_in_s": None if entry.expires is None else round(entry.expires - now, 1),
+                }
+                for entry in reversed(self._entries.values())
+            ]
+
+
+def file_version(path):
+    # Versão dos dados = caminho + data de modificação + tamanho do arquivo
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return (path, None, None)
+    return (path, stat.st_mtime_ns, stat.st_size)
@@ -0,0 +1,139 @@
+import logging
+
+import numpy as np
+import streamlit as st
+from streamlit.logger import get_logger
+
+from utils.profiling import timed
+
+# Logger configurado pelo Streamlit (nível vem de ``--logger.level``, padrão "info");
+# um ``logging.getLogger`` comum herdaria o WARNING do root e nunca apareceria
+logger = get_logger(__name__)
+
+# Acima deste número de pontos, traços "scatter" são enviados como "scattergl"
+GL_THRESHOLD = 1_000
+
+# Casas decimais exibidas para cada métrica do dataset. Valores como
+# 0.16899999999999998 vindos do CSV não precisam ir para o navegador inteiros.
+METRIC_PRECISION = {
+    "player_height": 0,
+    "player_weight": 0,
+    "age": 0,
+    "gp": 0,
+    "draft_year": 0,
+    "pts": 1,
+    "reb": 1,
+    "ast": 1,
+    "net_rating": 1,
+    "oreb_pct": 3,
+    "dreb_pct": 3,
+    "usg_pct": 3,
+    "ts_pct": 3,
+    "ast_pct": 3,
+}
+DEFAULT_PRECISION = 3
+
+# Tipos inteiros aceitos pelos typed arrays do Plotly, do menor para o maior
+_INT_DTYPES = (np.uint8, np.int8, np.uint16, np.int16, np.uint32, np.int32)
+
+_ARRAY_PROPS = ("x", "y")
+
+# Traços cujas amostras são agregadas no navegador (intervalos, quartis): arredondar
+# as amostras mudaria contagens e quartis, então elas são enviadas como estão
+_DISTRIBUTION_TYPES = {"histogram", "box", "violin"}
+
+
+def metric_precision(column):
+    return METRIC_PRECISION.get(column, DEFAULT_PRECISION)
+
+
+def _smallest_int_dtype(values):
+    low, high = values.min(), values.max()
+    for dtype in _INT_DTYPES:
+        info = np.iinfo(dtype)
+        if info.min <= low and high <= info.max:
+            return dtype
+    return None
+
+
+def compact_array(values, decimals):
+    """Arredonda e reduz o dtype; o Plotly serializa o resultado como typed array base64."""
+    if values is None:
+        return None
+    array = np.asarray(values)
+    if array.dtype.kind not in "iuf" or array.size == 0:
+        return values
+
+    array = np.round(array.astype(np.float64), decimals)
+    if decimals <= 0 and np.isfinite(array).all():
+        dtype = _smallest_int_dtype(array)
+        if dtype is not None:
+            return array.astype(dtype)
+    return array.astype(np.float32)
+
+
+def _to_webgl(trace):
+    import plotly.graph_objects as go
+
+    props = trace.to_plotly_json()
+    props.pop("type", None)
+    return go.Scattergl(props, skip_invalid=True)
+
+
+def _trace_size(trace):
+    for prop in _ARRAY_PROPS:
+        values = getattr(trace, prop, None)
+        if values is not None:
+            return len(values)
+    return 0
+
+
+def compact_figure(fig, precision=None, gl_threshold=GL_THRESHOLD):
+    """Devolve uma cópia da figura com payload reduzido.
+
+    ``precision`` mapeia a propriedade do traço ("x", "y", "marker.color")
+    para o número de casas decimais; o padrão é ``DEFAULT_PRECISION``. Traços
+    de distribuição (histograma, box, violino) não são arredondados.
+    """
+    # Importado aqui para que o plotly só seja carregado quando um gráfico é desenhado
+    import plotly.graph_objects as go
+
+    precision = precision or {}
+    fig = go.Figure(fig)
+    traces = []
+
+    for trace in fig.data:
+        if trace.type == "scatter" and _trace_size(trace) > gl_threshold:
+            trace = _to_webgl(trace)
+
+        for prop in _ARRAY_PROPS:
+            values = getattr(trace, prop, None)
+            if values is not None and trace.type not in _DISTRIBUTION_TYPES:
+                decimals = precision.get(prop, DEFAULT_PRECISION)
+                trace[prop] = compact_array(values, decimals)
+
+        marker = getattr(trace, "marker", None)
+        if marker is not None and marker.color is not None and not isinstance(marker.color, str):
+            decimals = precision.get("marker.color", DEFAULT_PRECISION)
+            marker.color = compact_array(marker.color, decimals)
+
+        traces.append(trace)
+
+    return go.Figure(data=traces, layout=fig.layout)
+
+
+def plotly_chart(fig, precision=None, **kwargs):
+    """Substitui ``st.plotly_chart`` enviando a versão compacta da figura."""
+    with timed("plotly_compactacao"):
+        fig = compact_figure(fig, precision)
+
+    if logger.isEnabledFor(logging.INFO):
+        import plotly.io as pio
+
+        title = fig.layout.title.text or "sem título"
+        payload = len(pio.to_json(fig, validate=False))
+        logger.info("Plotly '%s': %d traços, %.1f KB", title, len(fig.data), payload / 1024)
+
+    # Inclui a serialização da figura para JSON feita pelo Streamlit
+    with timed("plotly_serializacao"):
+        return st.plotly_chart(fig, **kwargs)
@@ -0,0 +1,37 @@
+import os
+
+import pandas as pd
+
+from utils.cache import CacheManager, file_version
+
+# Pode ser trocado por NBA_DATA_PATH, p.ex. para rodar com os datasets sintéticos dos benchmarks
+DATA_PATH = os.environ.get("NBA_DATA_PATH", "data/all_seasons.csv")
+
+# Métricas numéricas usadas nas comparações entre temporadas
+COMPARISON_METRICS = ["player_height", "player_weight", "age", "pts", "reb", "ast"]
+
+# Cache único do processo; é descartado sempre que o CSV muda no disco
+cache_manager = CacheManager(version_func=lambda: file_version(DATA_PATH))
+
+
+@cache_manager.cached("dataset")
+def _read_dataset(path):
+    try:
+        return pd.read_csv(path)
+    except FileNotFoundError:
+        return pd.DataFrame()
+
+
+# Carregamento compartilhado por todas as páginas, para que o cache seja um só
+def load_data():
+    # Cópia rasa: as páginas podem reatribuir colunas sem alterar o objeto em cache
+    return _read_dataset(DATA_PATH).copy(deep=False)
+
+
+@cache_manager.cached("aggregate")
+def season_means(metric):
+    df = load_data()
+    if df.empty or "season" not in df.columns or metric not in df.columns:
+        return pd.DataFrame(columns=["season", metric])
+    values = pd.to_numeric(df[metric], errors="coerce")
+    return values.groupby(df["season"]).mean().reset_index()
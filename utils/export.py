@@ -0,0 +1,124 @@
+import os
+import tempfile
+
+import streamlit as st
+
+# Número de linhas serializadas por vez. A memória extra da exportação fica
+# limitada a um bloco deste tamanho, independente do total de linhas.
+CHUNK_ROWS = 5_000
+
+EXPORT_FORMATS = {
+    "CSV": ("csv", "text/csv"),
+    "Parquet": ("parquet", "application/vnd.apache.parquet"),
+}
+
+
+def iter_chunks(df, columns, chunk_rows=CHUNK_ROWS):
+    """Percorre a visão filtrada em blocos de tamanho fixo, só com as colunas projetadas."""
+    for start in range(0, len(df), chunk_rows):
+        yield df.iloc[start:start + chunk_rows][columns]
+
+
+def iter_csv_chunks(df, columns, chunk_rows=CHUNK_ROWS):
+    """Gera o CSV em pedaços de bytes; o cabeçalho sai apenas no primeiro bloco."""
+    header = True
+    for chunk in iter_chunks(df, columns, chunk_rows):
+        yield chunk.to_csv(index=False, header=header).encode("utf-8")
+        header = False
+    if header:
+        # Visão vazia: ainda assim devolve um CSV válido com o cabeçalho
+        yield df.iloc[0:0][columns].to_csv(index=False).encode("utf-8")
+
+
+def write_csv(df, columns, fileobj, chunk_rows=CHUNK_ROWS):
+    for piece in iter_csv_chunks(df, columns, chunk_rows):
+        fileobj.write(piece)
+
+
+def write_parquet(df, columns, fileobj, chunk_rows=CHUNK_ROWS):
+    """Escreve um row group por bloco, reaproveitando o schema do primeiro."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    writer = None
+    try:
+        for chunk in iter_chunks(df, columns, chunk_rows):
+            if writer is None:
+                # O schema vem de um bloco com dados: colunas de texto com dtype
+                # object (pandas < 3) seriam inferidas como "null" em zero linhas
+                table = pa.Table.from_pandas(chunk, preserve_index=False)
+                writer = pq.ParquetWriter(fileobj, table.schema)
+            else:
+                table = pa.Table.from_pandas(chunk, schema=writer.schema, preserve_index=False)
+            writer.write_table(table, row_group_size=chunk_rows)
+        if writer is None:
+            # Visão vazia: ainda assim grava um arquivo válido só com o schema
+            table = pa.Table.from_pandas(df.iloc[0:0][columns], preserve_index=False)
+            writer = pq.ParquetWriter(fileobj, table.schema)
+            writer.write_table(table)
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+WRITERS = {
+    "CSV": write_csv,
+    "Parquet": write_parquet,
+}
+
+
+def export_to_tempfile(df, columns, fmt, chunk_rows=CHUNK_ROWS):
+    """Serializa para um arquivo temporário em disco e devolve-o aberto para leitura.
+
+    O retorno é um ``io.BufferedReader``, um dos tipos que o ``st.download_button``
+    aceita quando ``data`` é uma função.
+    """
+    extension = EXPORT_FORMATS[fmt][0]
+    with tempfile.NamedTemporaryFile(suffix=f".{extension}", delete=False) as fileobj:
+        WRITERS[fmt](df, columns, fileobj, chunk_rows)
+    reader = open(fileobj.name, "rb")
+    try:
+        # Em sistemas POSIX o arquivo some do disco assim que o leitor for fechado
+        os.unlink(fileobj.name)
+    except OSError:
+        # No Windows um arquivo aberto não pode ser removido; fica no diretório temporário
+        pass
+    return reader
+
+
+def render_export_section(df, key, file_prefix="nba_filtrado"):
+    st.write(f"**Exportar visão filtrada:** {len(df):,} registros")
+
+    col_cols, col_fmt = st.columns([3, 1])
+
+    with col_cols:
+        columns = st.multiselect(
+            "Colunas a exportar:",
+            options=list(df.columns),
+            default=list(df.columns),
+            key=f"{key}_export_columns"
+        )
+
+    with col_fmt:
+        fmt = st.radio(
+            "Formato:",
+            list(EXPORT_FORMATS),
+            horizontal=True,
+            key=f"{key}_export_format"
+        )
+
+    if not columns:
+        st.info("Selecione ao menos uma coluna para exportar.")
+        return
+
+    extension, mime = EXPORT_FORMATS[fmt]
+
+    # O arquivo só é gerado quando o usuário clica no botão, e não a cada rerun
+    st.download_button(
+        f"⬇️ Baixar {fmt}",
+        data=lambda: export_to_tempfile(df, columns, fmt),
+        file_name=f"{file_prefix}.{extension}",
+        mime=mime,
+        on_click="ignore",
+        key=f"{key}_export_download"
+    )
@@ -0,0 +1,37 @@
+import io
+
+import numpy as np
+
+from utils.data import cache_manager
+
+
+# Guarda o PNG já rasterizado: a renderização do matplotlib é a parte cara,
+# e uma figura viva não pode ser compartilhada com segurança entre sessões.
+@cache_manager.cached("figure")
+def heatmap_png(corr_matrix, title, figsize=(8, 6), triangular=False,
+                rotate_xticks=None, heatmap_kws=None, title_kws=None):
+    import seaborn as sns
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=figsize)
+    ax = fig.subplots()
+    mask = np.triu(np.ones_like(corr_matrix, dtype=bool)) if triangular else None
+    sns.heatmap(
+        corr_matrix,
+        annot=True,
+        cmap="coolwarm",
+        center=0,
+        square=True,
+        mask=mask,
+        ax=ax,
+        **(heatmap_kws or {})
+    )
+    ax.set_title(title, **(title_kws or {}))
+    if rotate_xticks is not None:
+        ax.tick_params(axis="x", labelrotation=rotate_xticks)
+        ax.tick_params(axis="y", labelrotation=0)
+
+    # Mesmos parâmetros que o st.pyplot usa ao salvar a figura
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format="png", dpi=200, bbox_inches="tight")
+    return buffer.getvalue()
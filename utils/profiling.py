@@ -0,0 +1,189 @@
+import contextvars
+import functools
+import json
+import os
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+try:
+    import psutil
+except ImportError:  # psutil é opcional; sem ele a memória vem de /proc
+    psutil = None
+
+# Amostras mantidas por seção para o cálculo de p50/p95
+MAX_SAMPLES = 500
+
+EXPORT_DIR = "profiling"
+
+# Pilha de seções ativas no rerun atual, para nomear seções aninhadas
+_current_section = contextvars.ContextVar("current_section", default=None)
+
+
+def _rss_bytes():
+    if psutil is not None:
+        return psutil.Process().memory_info().rss
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        return None
+
+
+class Profiler:
+    """Agrega latência e variação de memória por seção, entre reruns e sessões.
+
+    A variação de memória é o RSS do processo antes/depois da seção; com várias
+    sessões simultâneas ela é apenas indicativa.
+    """
+
+    def __init__(self, max_samples=MAX_SAMPLES):
+        self.max_samples = max_samples
+        self._samples = defaultdict(lambda: deque(maxlen=self.max_samples))
+        self._totals = defaultdict(lambda: [0, 0.0])
+        self._lock = threading.Lock()
+
+    def record(self, name, seconds, memory_delta=None):
+        with self._lock:
+            self._samples[name].append((seconds, memory_delta))
+            totals = self._totals[name]
+            totals[0] += 1
+            totals[1] += seconds
+
+    @contextmanager
+    def section(self, name):
+        parent = _current_section.get()
+        full_name = f"{parent}/{name}" if parent else name
+        token = _current_section.set(full_name)
+        memory_before = _rss_bytes()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            memory_after = _rss_bytes()
+            _current_section.reset(token)
+            delta = None if memory_before is None or memory_after is None else memory_after - memory_before
+            self.record(full_name, seconds, delta)
+
+    def timed(self, name=None):
+        """Versão decorador de ``section``; por padrão usa o nome da função."""
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.section(name or func.__qualname__):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def reset(self):
+        with self._lock:
+            self._samples.clear()
+            self._totals.clear()
+
+    def summary(self):
+        with self._lock:
+            snapshot = {name: list(samples) for name, samples in self._samples.items()}
+            totals = {name: tuple(values) for name, values in self._totals.items()}
+
+        rows = []
+        for name in sorted(snapshot):
+            seconds = np.array([sample[0] for sample in snapshot[name]])
+            deltas = [sample[1] for sample in snapshot[name] if sample[1] is not None]
+            count, total = totals[name]
+            rows.append({
+                "section": name,
+                "count": count,
+                "total_s": total,
+                "p50_ms": float(np.percentile(seconds, 50)) * 1000,
+                "p95_ms": float(np.percentile(seconds, 95)) * 1000,
+                "max_ms": float(seconds.max()) * 1000,
+                "mem_delta_p50_kb": float(np.percentile(deltas, 50)) / 1024 if deltas else None,
+                "mem_delta_max_kb": float(max(deltas)) / 1024 if deltas else None,
+            })
+        return rows
+
+    def to_json(self):
+        return json.dumps(
+            {"generated_at": time.time(), "pid": os.getpid(), "sections": self.summary()},
+            indent=2
+        )
+
+    def to_prometheus(self):
+        lines = [
+            "# HELP dashboard_section_seconds Latência por seção do dashboard.",
+            "# TYPE dashboard_section_seconds summary",
+        ]
+        rows = self.summary()
+        for row in rows:
+            label = _prometheus_label(row["section"])
+            lines.append(f'dashboard_section_seconds{{section="{label}",quantile="0.5"}} {row["p50_ms"] / 1000:.6f}')
+            lines.append(f'dashboard_section_seconds{{section="{label}",quantile="0.95"}} {row["p95_ms"] / 1000:.6f}')
+            lines.append(f'dashboard_section_seconds_sum{{section="{label}"}} {row["total_s"]:.6f}')
+            lines.append(f'dashboard_section_seconds_count{{section="{label}"}} {row["count"]}')
+
+        lines += [
+            "# HELP dashboard_section_memory_delta_bytes Mediana da variação de RSS por seção.",
+            "# TYPE dashboard_section_memory_delta_bytes gauge",
+        ]
+        for row in rows:
+            if row["mem_delta_p50_kb"] is not None:
+                label = _prometheus_label(row["section"])
+                lines.append(f'dashboard_section_memory_delta_bytes{{section="{label}"}} {row["mem_delta_p50_kb"] * 1024:.0f}')
+        return "\n".join(lines) + "\n"
+
+    def export(self, directory=EXPORT_DIR):
+        """Grava ``metrics.json`` e ``metrics.prom`` no diretório e devolve os caminhos."""
+        os.makedirs(directory, exist_ok=True)
+        paths = {
+            "json": os.path.join(directory, "metrics.json"),
+            "prometheus": os.path.join(directory, "metrics.prom"),
+        }
+        with open(paths["json"], "w", encoding="utf-8") as file:
+            file.write(self.to_json())
+        with open(paths["prometheus"], "w", encoding="utf-8") as file:
+            file.write(self.to_prometheus())
+        return paths
+
+
+def _prometheus_label(value):
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+# Instância única do processo, compartilhada por todas as páginas e sessões
+profiler = Profiler()
+timed = profiler.section
+
+
+def render_profiling_table(container=None):
+    container = container or st
+    rows = profiler.summary()
+    if not rows:
+        container.info("Nenhuma seção medida ainda.")
+        return
+
+    table = pd.DataFrame(rows)[["section", "count", "p50_ms", "p95_ms", "max_ms", "mem_delta_p50_kb"]]
+    table = table.rename(columns={
+        "section": "Seção",
+        "count": "Execuções",
+        "p50_ms": "p50 (ms)",
+        "p95_ms": "p95 (ms)",
+        "max_ms": "Máx. (ms)",
+        "mem_delta_p50_kb": "Δ memória p50 (KB)",
+    })
+    container.dataframe(table.round(1), hide_index=True, use_container_width=True)
+
+    if container.button("💾 Exportar métricas (JSON + Prometheus)", key="profiling_export"):
+        paths = profiler.export()
+        container.success(f"Métricas gravadas em `{paths['json']}` e `{paths['prometheus']}`")
+
+
+def render_profiling_sidebar():
+    st.sidebar.markdown("---")
+    if st.sidebar.checkbox("⏱️ Mostrar perfil de latência", key="show_profiling"):
+        render_profiling_table(st.sidebar)
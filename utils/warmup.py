@@ -0,0 +1,66 @@
+import importlib
+import threading
+import time
+
+import pandas as pd
+import streamlit as st
+from streamlit.logger import get_logger
+
+from utils import data
+
+# Logger configurado pelo Streamlit; com logging.getLogger o INFO seria descartado
+logger = get_logger(__name__)
+
+# Bibliotecas de gráficos que as páginas só importam quando um gráfico é desenhado
+PLOTTING_MODULES = ("plotly.express", "matplotlib.pyplot", "seaborn")
+
+# Duração (s) de cada etapa do aquecimento, preenchida pela thread em segundo plano
+TIMINGS = {}
+
+
+def _timed(name, func, *args):
+    start = time.perf_counter()
+    func(*args)
+    TIMINGS[name] = time.perf_counter() - start
+
+
+def _warmup():
+    start = time.perf_counter()
+    try:
+        _timed("load_data", data.load_data)
+        for metric in data.COMPARISON_METRICS:
+            _timed(f"season_means[{metric}]", data.season_means, metric)
+        for module in PLOTTING_MODULES:
+            _timed(f"import {module}", importlib.import_module, module)
+    except Exception:
+        logger.exception("Falha no aquecimento dos caches")
+    TIMINGS["total"] = time.perf_counter() - start
+    logger.info(
+        "Aquecimento concluído: %s",
+        ", ".join(f"{name}={seconds * 1000:.0f}ms" for name, seconds in TIMINGS.items())
+    )
+
+
+# Executado uma única vez por processo do servidor, na primeira sessão que chegar
+@st.cache_resource(show_spinner=False)
+def start_warmup():
+    thread = threading.Thread(target=_warmup, name="nba-warmup", daemon=True)
+    thread.start()
+    return thread
+
+
+def render_startup_timings():
+    thread = start_warmup()
+    with st.expander("⏱️ Tempos de inicialização"):
+        if thread.is_alive():
+            st.info("Aquecimento dos caches em andamento...")
+        # Cópia, pois a thread de aquecimento pode estar escrevendo no dicionário
+        timings = list(TIMINGS.items())
+        if timings:
+            st.dataframe(
+                pd.DataFrame(
+                    [(name, round(seconds * 1000, 1)) for name, seconds in timings],
+                    columns=["Etapa", "Tempo (ms)"]
+                ),
+                hide_index=True
+            )